@@ -5,7 +5,7 @@ import pytest
 
 import utype
 from utype import Field, Options, Schema, exc
-from utype.utils.style import AliasGenerator
+from utype.utils.style import CASE_STYLES, AliasGenerator
 
 
 @pytest.fixture(params=(False, True))
@@ -36,6 +36,21 @@ class TestOptions:
         u1 = UserIgnore()
         assert dict(u1) == {"level": 0}
 
+        class IgnoreOptions(Options):
+            ignore_required = True
+
+        class SubIgnoreOptions(IgnoreOptions):
+            ignore_required = False
+
+        assert IgnoreOptions.initialize() is IgnoreOptions.initialize()
+        assert IgnoreOptions.initialize().ignore_required
+        assert not SubIgnoreOptions.initialize().ignore_required
+        # class attributes changed after the first initialize() take effect
+        IgnoreOptions.ignore_required = False
+        assert not IgnoreOptions.initialize().ignore_required
+        IgnoreOptions.max_depth = 3
+        assert IgnoreOptions.initialize().max_depth == 3
+
         class UserSchemaIgnore(Schema):
             __options__ = Options(ignore_required=True)
             name: str
@@ -96,9 +111,95 @@ class TestOptions:
         del a.attr
         assert dict(a) == {}
 
+    def test_decorator(self):
+        @Options(immutable=True)
+        class DecoratedSchema(Schema):
+            attr: str = ''
+
+        with pytest.raises(exc.UpdateError):
+            DecoratedSchema(attr='x').attr = 'y'
+        # the parser follows the module of the decorated class
+        parser = DecoratedSchema.__parser__
+        assert parser.module_name == __name__
+        assert parser.globals['__name__'] == __name__
+
     # def test_secret_names(self):
     #     pass
 
+    def test_generate_from(self):
+        a = Options(ignore_required=True)
+        b = Options(max_depth=5)
+        assert Options.generate_from(a) is a
+        merged = Options.generate_from(a, None, b, {'ignore_required': False})
+        assert merged.max_depth == 5 and merged.ignore_required is False
+        assert merged._options == (a & b & Options(ignore_required=False))._options
+
+        # override options replace the former ones and ignore the latter ones
+        override = Options(override=True, max_depth=3)
+        assert Options.generate_from(a, override, b) is override
+        assert Options.generate_from(a, b, override) is override
+
+    def test_alias_generator(self):
+        assert AliasGenerator.snake('attrName') == 'attr_name'
+        assert AliasGenerator.cap_kebab('attrName') == 'ATTR-NAME'
+        assert AliasGenerator.camel('attr_name') == 'attrName'
+        assert AliasGenerator.pascal('attr-name') == 'AttrName'
+
+        aliases = AliasGenerator.generate_aliases('attr_name')
+        assert aliases == ['attrName', 'AttrName', 'attr-name', 'ATTR-NAME', 'ATTR_NAME']
+        # cached results are returned as a fresh list
+        aliases.append('@attr_name')
+        assert AliasGenerator.generate_aliases('attr_name') == aliases[:-1]
+        assert AliasGenerator.generate_aliases('attr_name', ['camel', lambda x: '@' + x]) == \
+            ['attrName', '@attr_name']
+        # guess the style from an example value
+        assert AliasGenerator.guess_style('MY_NAME') == 'cap_snake'
+        assert AliasGenerator.guess_style('MY-NAME') == 'cap_kebab'
+        assert AliasGenerator.guess_style('my_name') == 'snake'
+        assert AliasGenerator.guess_style('my-name') == 'kebab'
+        assert AliasGenerator.guess_style('myName') == 'camel'
+        assert AliasGenerator.guess_style('x1Y2') == 'camel'
+        assert AliasGenerator.guess_style('MyName') == 'pascal'
+        assert AliasGenerator.guess_style('!!') is None
+        with pytest.raises(ValueError):
+            AliasGenerator('!!')
+        assert AliasGenerator.get('camel') is AliasGenerator.get('camel')
+        assert AliasGenerator.get('kebab')('attrName') == 'attr-name'
+        # only the fixed style names are shared
+        generator = lambda x: '@' + x
+        assert AliasGenerator.get(generator) is not AliasGenerator.get(generator)
+        assert all(style in CASE_STYLES for _, style in AliasGenerator.__instances__)
+
+    def test_alias_generator_failed(self):
+        import warnings
+        from utype.settings import warning_settings
+
+        def fail(val):
+            raise ValueError(val)
+
+        generator = AliasGenerator(fail)
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+            assert generator('attr_name') == 'attr_name'
+            assert generator({'a': 1, 'b': 2, 'c': 3}) == {'a': 1, 'b': 2, 'c': 3}
+        # repeated failures of the same error type only warn once
+        assert len(records) == 1
+
+        def fail_type(val):
+            raise TypeError(val)
+
+        generator.func = fail_type
+        with pytest.warns(UserWarning):
+            assert generator('attr_name') == 'attr_name'
+
+        try:
+            warning_settings.alias_generator_failed = False
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                assert AliasGenerator(fail)({'attr_name': 1}) == {'attr_name': 1}
+        finally:
+            warning_settings.alias_generator_failed = True
+
     def test_alias(self):
         # case styles
         class AllowCaseSchema(Schema):
@@ -12,3 +12,39 @@ class TestSpec:
         assert JsonSchemaParser({'type': 'array'})() == list
         assert JsonSchemaParser({'type': 'string'})() == str
         assert JsonSchemaParser({'type': 'string', 'format': 'date'})() == date
+
+    def test_json_schema_generator_recursive(self):
+        from utype import Schema, JsonSchemaGenerator
+        from typing import List
+
+        class InfiniteSchema(Schema):
+            name: str
+            self: List['InfiniteSchema'] = None
+
+        assert JsonSchemaGenerator(InfiniteSchema)() == {
+            'type': 'object',
+            'properties': {'name': {'type': 'string'}, 'self': {'type': 'array', 'items': {'$ref': '#'}}},
+            'required': ['name']
+        }
+
+        defs = {}
+        assert JsonSchemaGenerator(InfiniteSchema, defs=defs)() == {'$ref': '#/$defs/InfiniteSchema'}
+        assert defs[InfiniteSchema]['properties']['self'] == {
+            'type': 'array', 'items': {'$ref': '#/$defs/InfiniteSchema'}}
+
+    def test_json_schema_generator_cycle_below_root(self):
+        from utype import Schema, JsonSchemaGenerator
+        from typing import Optional
+
+        class Node(Schema):
+            value: int
+            child: Optional['Node'] = None
+
+        class Tree(Schema):
+            root: Node
+
+        schema = JsonSchemaGenerator(Tree)()
+        assert schema['properties']['root'] == {'$ref': '#/$defs/Node'}
+        node = schema['$defs']['Node']
+        assert node['properties']['value'] == {'type': 'integer'}
+        assert {'$ref': '#/$defs/Node'} in node['properties']['child']['anyOf']
@@ -1,29 +1,81 @@
-from .decorator import apply, dataclass, handle, parse, raw
-from .parser.field import Field, Param
-from .parser.options import Options
-from .parser.rule import Lax, Rule
-from .schema import DataClass, LogicalMeta, Schema
+from typing import TYPE_CHECKING
+
 from .utils import exceptions as exc
-from .utils.encode import register_encoder, JSONEncoder
-from .utils.transform import (TypeTransformer, type_transform)
-from .utils.datastructures import unprovided
-from .specs.json_schema import JsonSchemaGenerator
 
-register_transformer = TypeTransformer.registry.register
+if TYPE_CHECKING:
+    # real imports for static analysers and IDEs, resolved lazily at runtime through _LAZY_ATTRS,
+    # which is also the source of __all__
+    from . import decorator, parser, schema, settings, specs, types, utils
+    from .decorator import apply, dataclass, handle, parse, raw
+    from .parser.field import Field, Param
+    from .parser.options import Options
+    from .parser.rule import Lax, Rule
+    from .schema import DataClass, LogicalMeta, Schema
+    from .utils.encode import register_encoder, JSONEncoder
+    from .utils.transform import TypeTransformer, type_transform, type_transform_many
+    from .utils.datastructures import unprovided
+    from .specs.json_schema import JsonSchemaGenerator
 
+    register_transformer = TypeTransformer.registry.register
 
-VERSION = (0, 6, 3)
+_LAZY_ATTRS = {
+    # name: (module, attribute path), import on first access
+    # so that "import utype" does not load the parser machinery
+    'apply': ('.decorator', 'apply'),
+    'dataclass': ('.decorator', 'dataclass'),
+    'handle': ('.decorator', 'handle'),
+    'parse': ('.decorator', 'parse'),
+    'raw': ('.decorator', 'raw'),
+    'Field': ('.parser.field', 'Field'),
+    'Param': ('.parser.field', 'Param'),
+    'Options': ('.parser.options', 'Options'),
+    'Lax': ('.parser.rule', 'Lax'),
+    'Rule': ('.parser.rule', 'Rule'),
+    'DataClass': ('.schema', 'DataClass'),
+    'LogicalMeta': ('.schema', 'LogicalMeta'),
+    'Schema': ('.schema', 'Schema'),
+    'TypeTransformer': ('.utils.transform', 'TypeTransformer'),
+    'type_transform': ('.utils.transform', 'type_transform'),
+    'type_transform_many': ('.utils.transform', 'type_transform_many'),
+    'register_transformer': ('.utils.transform', 'TypeTransformer.registry.register'),
+    'unprovided': ('.utils.datastructures', 'unprovided'),
+    'register_encoder': ('.utils.encode', 'register_encoder'),
+    'JSONEncoder': ('.utils.encode', 'JSONEncoder'),
+    'JsonSchemaGenerator': ('.specs.json_schema', 'JsonSchemaGenerator'),
+}
+
+__all__ = [*_LAZY_ATTRS, 'exc', 'version_info']
+
+_LAZY_SUBMODULES = frozenset({
+    'decorator', 'parser', 'schema', 'settings', 'specs', 'types', 'utils',
+})
 
 
-def _get_version():
-    pre_release = VERSION[3] if len(VERSION) > 3 else ""
-    version = ".".join([str(v) for v in VERSION[:3]])
-    if pre_release:
-        version += f"-{pre_release}"
-    return version
+def __getattr__(name):
+    import importlib
+    if name in _LAZY_SUBMODULES:
+        # importing the submodule binds it as an attribute of this package
+        return importlib.import_module(f'.{name}', __name__)
+    try:
+        module, path = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = importlib.import_module(module, __name__)
+    for attr in path.split('.'):
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
 
 
-__version__ = _get_version()
+def __dir__():
+    return sorted(set(globals()).union(_LAZY_ATTRS, _LAZY_SUBMODULES))
+
+
+VERSION = (0, 6, 3)
+
+__version__ = f"{VERSION[0]}.{VERSION[1]}.{VERSION[2]}" + (
+    f"-{VERSION[3]}" if len(VERSION) > 3 and VERSION[3] else ""
+)
 
 
 def version_info() -> str:
@@ -1,5 +1,3 @@
-import inspect
-import warnings
 from typing import Any, Callable, Iterable, Type, TypeVar, Union
 
 from .parser.cls import ClassParser
@@ -7,13 +5,32 @@ from .parser.func import FunctionParser
 from .parser.options import Options
 from .parser.rule import Lax, Rule
 from .utils import exceptions as exc
-from .utils.datastructures import Unprovided, unprovided
+from .utils.datastructures import unprovided
 from .settings import warning_settings
 
 T = TypeVar("T")
 FUNC = TypeVar("FUNC")
 CLS = TypeVar("CLS")
 
+_CONSTRAINT_NAMES = (
+    "enum",
+    "gt",
+    "ge",
+    "lt",
+    "le",
+    "min_length",
+    "max_length",
+    "length",
+    "regex",
+    "max_digits",
+    "decimal_places",
+    "multiple_of",
+    "contains",
+    "max_contains",
+    "min_contains",
+    "unique_items",
+)
+
 
 def raw(f: FUNC):
     parser = getattr(f, "__parser__", None)
@@ -41,7 +58,7 @@ def parse(
         )
 
     def decorator(func: T) -> T:
-        if inspect.isclass(func):
+        if isinstance(func, type):
             # class
             parser_cls.apply_class(
                 func,
@@ -61,7 +78,7 @@ def parse(
                 # first_reserve=not static
             )
 
-    if f:
+    if f is not None:
         return decorator(f)
     return decorator
 
@@ -116,7 +133,7 @@ def dataclass(
 
         return parser.obj
 
-    if obj:
+    if obj is not None:
         return decorator(obj)
     return decorator
 
@@ -147,49 +164,51 @@ def apply(
     min_contains: int = None,
     unique_items: bool = None,
 ):
-    # if rule_cls:
-    #     pass
-
     if round:
-        if decimal_places and decimal_places not in (round, Lax(round)):
+        lax_decimal_places = Lax(round)
+        if decimal_places and decimal_places not in (round, lax_decimal_places):
             raise exc.ConfigError(
                 f"@apply round: {round} is a shortcut for decimal_places=Lax({round}), "
                 f"but you specified a different decimal_places: {repr(decimal_places)}"
             )
 
-        decimal_places = Lax(round)
+        decimal_places = lax_decimal_places
 
     constraints = {
-        k: v
-        for k, v in dict(
-            enum=enum,
-            gt=gt,
-            ge=ge,
-            lt=lt,
-            le=le,
-            min_length=min_length,
-            max_length=max_length,
-            length=length,
-            regex=regex,
-            max_digits=max_digits,
-            decimal_places=decimal_places,
-            multiple_of=multiple_of,
-            contains=contains,
-            max_contains=max_contains,
-            min_contains=min_contains,
-            unique_items=unique_items,
-        ).items()
-        if v is not None
+        key: value
+        for key, value in zip(
+            _CONSTRAINT_NAMES,
+            (
+                enum,
+                gt,
+                ge,
+                lt,
+                le,
+                min_length,
+                max_length,
+                length,
+                regex,
+                max_digits,
+                decimal_places,
+                multiple_of,
+                contains,
+                max_contains,
+                min_contains,
+                unique_items,
+            ),
+        )
+        if value is not None
     }
 
-    if not isinstance(const, Unprovided):
-        constraints.update(const=const)
+    if const is not unprovided:
+        constraints["const"] = const
 
     def decorator(_type):
         cls = rule_cls.annotate(_type, constraints=constraints)
         cls.__name__ = getattr(_type, "__name__", cls.__name__)
-        cls.__repr__ = getattr(_type, "__repr__", cls.__repr__)
-        cls.__str__ = getattr(_type, "__str__", cls.__str__)
+        # every object has __repr__ / __str__, no default needed
+        cls.__repr__ = _type.__repr__
+        cls.__str__ = _type.__str__
         cls.__applied__ = True
         # applied Rule only checks constraints if value is not the instance of the __origin__ type
         return cls
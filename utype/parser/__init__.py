@@ -0,0 +1 @@
+from . import options, rule, field, base, func, cls
@@ -1,6 +1,7 @@
 import inspect
 import sys
 import warnings
+from collections.abc import Mapping
 from typing import Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
 from ..utils import exceptions as exc
@@ -52,10 +53,10 @@ class BaseParser:
         key = obj
         if not options:
             options = getattr(obj, '__options__', None)
-        if not no_cache and key in __parsers__:
-            cached: "BaseParser" = __parsers__[key]
+        if not no_cache:
+            cached: "BaseParser" = __parsers__.get(key)
             # if options is not identical, make a new one
-            if not options or options == cached.options:
+            if cached is not None and (not options or options == cached.options):
                 return cached
         inst = cls(obj, options=options, **kwargs)      # noqa
         if not no_cache:
@@ -76,6 +77,8 @@ class BaseParser:
         # these data structures are designed to speed up the parsing
         self.case_insensitive_names: Set[str] = set()
         self.field_alias_map: Dict[str, str] = {}
+        self.field_lookup: Optional[Dict[str, ParserField]] = None
+        # name / alias -> field, built after the aliases are generated
         self.attr_alias_map: Dict[str, str] = {}
         self.error_hooks: Dict[Type[Exception], Callable] = {}
         self.data_first_search = None
@@ -149,7 +152,15 @@ class BaseParser:
     #     return self._get_field_from(self.input_fields, key)
 
     def get_field(self, key: str) -> Optional[ParserField]:
-        return self._get_field_from(self.fields, key)
+        lookup = self.field_lookup
+        if lookup is None:
+            return self._get_field_from(self.fields, key)
+        field = lookup.get(key)
+        if field is None and self.case_insensitive_names and not key.islower():
+            lower_key = key.lower()
+            if lower_key in self.case_insensitive_names:
+                return lookup.get(lower_key)
+        return field
 
     def get_attrs(self, data: Union[list, tuple, set, dict, str]):
         if isinstance(data, dict):
@@ -183,7 +194,7 @@ class BaseParser:
         else:
             self.data_first_search = False
 
-    @property
+    @cached_property
     def rule_cls(self):
         return self.parser_field_cls.rule_cls
 
@@ -213,11 +224,13 @@ class BaseParser:
             return False
         clear_refs = []
         resolved = False
+        # ClassParser.globals builds a patched copy of the module namespace, get it once
+        global_vars = self.globals
         # todo: add resolve hooks so that application code can execute lazy-load type process logic
         for name in list(self.forward_refs):
             ref, constraints = self.forward_refs[name]
             try:
-                evaluate_forward_ref(ref, self.globals, local_vars)
+                evaluate_forward_ref(ref, global_vars, local_vars)
                 if ref.__forward_evaluated__:
                     # evaluated successfully, pop
                     value = ref.__forward_value__
@@ -232,7 +245,7 @@ class BaseParser:
                         ref.__forward_value__ = self.rule_cls.parse_annotation(
                             annotation=value,
                             constraints=constraints,
-                            global_vars=self.globals,
+                            global_vars=global_vars,
                             forward_refs=self.forward_refs,
                             forward_key=name,
                         )
@@ -305,10 +318,9 @@ class BaseParser:
         if case_insensitive_names:
             for key, field in self.fields.items():
                 if not field.is_case_insensitive(self.options):
-                    lower_keys = set(a.lower() for a in field.aliases).union(
-                        {key.lower()}
+                    inter = case_insensitive_names.intersection(
+                        {key.lower(), *(a.lower() for a in field.aliases)}
                     )
-                    inter = case_insensitive_names.intersection(lower_keys)
                     if inter:
                         raise exc.ConfigError(
                             f"{self.obj}: case sensitive field: [{repr(key)}] "
@@ -323,6 +335,10 @@ class BaseParser:
         self.field_alias_map = alias_map
         self.attr_alias_map = attr_alias_map
         self.case_insensitive_names = case_insensitive_names
+        # field names take precedence over aliases
+        field_lookup = {alias: self.fields[key] for alias, key in alias_map.items()}
+        field_lookup.update(self.fields)
+        self.field_lookup = field_lookup
 
         for key, field in self.fields.items():
             field.apply_fields(
@@ -335,12 +351,13 @@ class BaseParser:
     def __ref__(self):
         return f"{self.obj.__module__}.{self.obj.__qualname__}"
 
-    @property
+    @cached_property
     def cls(self):
         return self.obj if inspect.isclass(self.obj) else None
 
     def __call__(self, data: dict, context: RuntimeContext = None) -> dict:
-        if not isinstance(data, dict):
+        if type(data) is not dict and not isinstance(data, Mapping):
+            # mappings are read through items() / get() / in, no need to copy
             data = dict(data)
         self.resolve_forward_refs(ignore_errors=False)
         if not context:
@@ -433,9 +450,13 @@ class BaseParser:
         unprovided_fields = set()
         options = context.options
 
+        get_field = self.get_field
+        ignore_alias_conflicts = options.ignore_alias_conflicts
+
         for key, value in data.items():
-            key = str(key)
-            field = self.get_field(key)
+            if type(key) is not str:
+                key = str(key)
+            field = get_field(key)
             if not field:
                 add_value = self.parse_addition(key, value, context=context)
                 if not unprovided(add_value):
@@ -452,7 +473,7 @@ class BaseParser:
                     result[name] = default
                 continue
 
-            if not options.ignore_alias_conflicts:
+            if not ignore_alias_conflicts:
                 if name in result:  # or (excluded_keys and name in excluded_keys):
                     if result[name] != value:
                         context.handle_error(exc.AliasConflictError(item=name, value=value))
@@ -489,11 +510,10 @@ class BaseParser:
                     result[name] = default
 
         if dependencies:
-            dependant = set(result)
+            # set.difference looks up the result dict directly, no need to copy its keys
+            diff = dependencies.difference(result)
             if excluded_keys:
-                dependant.update(excluded_keys)
-
-            diff = dependencies.difference(dependant)
+                diff.difference_update(excluded_keys)
             lack = dependencies.intersection(unprovided_fields)
             lack.update(diff)
             if lack:
@@ -516,14 +536,16 @@ class BaseParser:
         as_attname: bool = False,
         excluded_keys: List[str] = None,
     ):
-        if self.case_insensitive_names:
+        case_insensitive_names = self.case_insensitive_names
+        if case_insensitive_names:
+            # field first search is only picked for case insensitive parsers
+            # when explicitly set by data_first_search=False
             _data = {}
             for k, v in data.items():
-                k = str(k)
-                if k.lower() in self.case_insensitive_names:
-                    _data[k.lower()] = v
-                else:
-                    _data[k] = v
+                if type(k) is not str:
+                    k = str(k)
+                lower_key = k if k.islower() else k.lower()
+                _data[lower_key if lower_key in case_insensitive_names else k] = v
             data = _data
 
         result = {}
@@ -531,21 +553,26 @@ class BaseParser:
         dependencies = set()
         unprovided_fields = set()
         options = context.options
+        ignore_alias_conflicts = options.ignore_alias_conflicts
 
-        for key, field in self.fields.items():
+        for field in self.fields.values():
             value = unprovided
             name = field.attname if as_attname else field.name
 
             if excluded_keys and name in excluded_keys:
                 continue
 
-            if options.ignore_alias_conflicts:
-                for alias in field.all_aliases:
+            all_aliases = field.all_aliases
+            if len(all_aliases) == 1:
+                # no alias, only the field name itself
+                value = data.get(all_aliases[0], unprovided)
+            elif ignore_alias_conflicts:
+                for alias in all_aliases:
                     if alias in data:
                         value = data[alias]
                         break
             else:
-                for alias in field.all_aliases:
+                for alias in all_aliases:
                     if alias in data:
                         if unprovided(value):
                             value = data[alias]
@@ -567,7 +594,7 @@ class BaseParser:
                     result[name] = default
                 continue
 
-            used_alias.update(field.all_aliases)
+            used_alias.update(all_aliases)
             # even if field is no-input, it can still set default (by developer, no by input)
             if field.is_no_input(value, options=options):
                 # no input field does not take input from __init__
@@ -588,11 +615,10 @@ class BaseParser:
                 )
 
         if dependencies:
-            dependant = set(result)
+            # set.difference looks up the result dict directly, no need to copy its keys
+            diff = dependencies.difference(result)
             if excluded_keys:
-                dependant.update(excluded_keys)
-
-            diff = dependencies.difference(dependant)
+                diff.difference_update(excluded_keys)
             lack = dependencies.intersection(unprovided_fields)
             lack.update(diff)
             if lack:
@@ -6,7 +6,7 @@ from typing import Callable, Dict, Type, TypeVar
 
 from ..utils import exceptions as exc
 from ..utils.compat import is_classvar, is_final
-from ..utils.datastructures import unprovided
+from ..utils.datastructures import cached_property, unprovided
 from ..utils.functional import pop
 from ..utils.transform import TypeTransformer
 from .base import BaseParser
@@ -31,7 +31,7 @@ class ClassParser(BaseParser):
         super().__init__(obj, *args, **kwargs)
         self.init_parser = None
 
-    @property
+    @cached_property
     def in_out_identical(self):
         for val in self.fields.values():
             if val.no_input is True and val.no_output is True:
@@ -45,13 +45,19 @@ class ClassParser(BaseParser):
         self.generate_from_bases()
         super().setup()
 
+    @cached_property
+    def bases_annotations(self):
+        # (base, annotations) of the direct bases, walked for every class attribute
+        return tuple(
+            (base, getattr(base, "__annotations__", None))
+            for base in self.obj.__bases__
+            if base is not object
+        )
+
     def validate_class_field_name(self, name: str):
         if not self.validate_field_name(name):
             return False
-        for base in self.obj.__bases__:
-            if base is object:
-                continue
-            annotations = getattr(base, "__annotations__", None)
+        for base, annotations in self.bases_annotations:
             if annotations:
                 # maybe object
                 annotation = annotations.get(name)
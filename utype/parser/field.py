@@ -185,14 +185,15 @@ class Field(ParamsCollector):
                     )
 
         if round:
-            if decimal_places and decimal_places not in (round, Lax(round)):
+            lax_decimal_places = Lax(round)
+            if decimal_places and decimal_places not in (round, lax_decimal_places):
                 raise exc.ConfigError(
                     f"Field round: {round} is a shortcut for decimal_places=Lax({round}), "
                     f"but you specified a different decimal_places: {represent(decimal_places)}",
                     params={"round": round, "decimal_places": decimal_places},
                 )
 
-            decimal_places = Lax(round)
+            decimal_places = lax_decimal_places
 
         self.alias = alias if isinstance(alias, str) else None
         self.alias_generator = alias if callable(alias) else None
@@ -143,7 +143,7 @@ class FunctionParser(BaseParser):
         self.is_asynchronous = self.is_coroutine or self.is_async_generator
         self.is_passed = self.function_pass(func)
 
-        parameters = inspect.signature(func).parameters.items()
+        parameters = tuple(inspect.signature(func).parameters.items())
 
         if self.from_class:
             # within a class context, the instance method is easy to detect
@@ -164,7 +164,7 @@ class FunctionParser(BaseParser):
             ):
                 # guess instance method
                 if len(parameters) >= 1:
-                    (fk, first_param), *_rest = parameters
+                    fk, first_param = parameters[0]
                     first_param: inspect.Parameter
                     if (
                         first_param.kind
@@ -182,8 +182,8 @@ class FunctionParser(BaseParser):
 
         self.reserve_name = None
         if self.first_reserve:
-            _r, *parameters = parameters
-            self.reserve_name = _r[0]
+            self.reserve_name = parameters[0][0]
+            parameters = parameters[1:]
 
         # annotates = {k: v.annotation for k, v in self.parameters if v.annotation is not v.empty}
         # defaults = {k: v.default for k, v in self.parameters if v.default is not v.empty}
@@ -183,22 +183,18 @@ class Options:
                 )
                 max_errors = None
 
-        options = {}
-        for key, val in locals().items():
-            if unprovided(val):
-                continue
-            if key.startswith('_'):
-                continue
-            if hasattr(self, key):
-                # if getattr(self, key) == val:
-                #     continue
-                self.__dict__[key] = val
-                options[key] = val
+        params = locals()
+        # every option defaults to the unprovided singleton, compare by identity
+        options = {
+            key: params[key] for key in self._option_names
+            if params[key] is not unprovided
+        }
+        self.__dict__.update(options)
         self._options = options
 
-    _option_names = [
-        k for k, v in inspect.signature(__init__).parameters.items() if k != "self"
-    ]
+    # every option is keyword-only, read the names off the defaults
+    _option_names = tuple(__init__.__kwdefaults__)
+    _option_names_set = frozenset(_option_names)
 
     def __repr__(self):
         options = [f"{key}={repr(val)}" for key, val in self._options.items()]
@@ -209,8 +205,15 @@ class Options:
 
     @classmethod
     def initialize(cls):
-        options = {k: v for k, v in cls.__dict__.items() if k in cls._option_names}
-        return cls(**options)
+        options = {k: v for k, v in cls.__dict__.items() if k in cls._option_names_set}
+        # reuse the instance across decorations until the class attributes change
+        # use __dict__ so that subclasses won't get the instance of base class
+        initialized = cls.__dict__.get("__initialized__")
+        if initialized is not None and initialized[0] == options:
+            return initialized[1]
+        inst = cls(**options)
+        cls.__initialized__ = (options, inst)
+        return inst
 
     @property
     def vacuum(self):
@@ -275,6 +278,7 @@ class Options:
         if not options:
             return cls()
         res = None
+        merged = None
         for opt in options:
             if not opt:
                 continue
@@ -283,7 +287,7 @@ class Options:
                     opt = opt.initialize()
                 else:
                     opt = {
-                        k: v for k, v in opt.__dict__.items() if k in cls._option_names
+                        k: v for k, v in opt.__dict__.items() if k in cls._option_names_set
                     }
             if isinstance(opt, dict):  # accept from dict
                 opt = cls(**opt)
@@ -293,8 +297,14 @@ class Options:
                 continue
             if not res or opt.override:
                 res = opt
+                merged = None
+            elif res.override:
+                continue
             else:
-                res &= opt
+                # same as res &= opt, but only construct the merged Options once
+                merged = {**(merged or res._options), **opt._options}
+        if merged:
+            return res.__class__(**merged)
         return res or cls()
 
     def __and__(self, other: "Options") -> "Options":
@@ -306,9 +316,7 @@ class Options:
             return other
         if self.override:
             return self
-        specs = dict(self._options)
-        specs.update(other._options)
-        return self.__class__(**specs)
+        return self.__class__(**{**self._options, **other._options})
 
     def __call__(self, fn=None, *args, **kwargs):
         # fn can be a schema or function
@@ -326,12 +334,28 @@ class Options:
         return fn
 
 
+# used when no options are given (type_transform / RuntimeContext), utype never mutates it
+DEFAULT_OPTIONS = Options()
+
+
 class RuntimeContext:
+    # a context is created at every level of the parsing
+    __slots__ = (
+        "context",
+        "depth",
+        "route",
+        "errors",
+        "tmp_errors",
+        "warnings",
+        "cls",
+        "error_hooks",
+        "options",
+        "force_error",
+    )
+
     override: bool = False
     depth: int
 
-    routes: list
-
     def __init__(
         self,
         context: "RuntimeContext" = None,
@@ -346,13 +370,7 @@ class RuntimeContext:
         self.depth = context.depth if context else 0
 
         self.route = route
-        self.routes = []
-        if self.context:
-            self.routes = list(self.context.routes)
-
-        if route:
-            self.routes.append(route)
-        else:
+        if not route:
             self.depth += 1
 
         self.errors = []
@@ -361,7 +379,8 @@ class RuntimeContext:
         self.cls = cls
         # self.cls_routes = []
         self.error_hooks = error_hooks
-        self.options: Options = options or Options()
+        # share the default Options, it is never mutated
+        self.options: Options = options or DEFAULT_OPTIONS
         self.force_error = force_error
 
         # if options:
@@ -424,6 +443,15 @@ class RuntimeContext:
     #         error_hooks=self.error_hooks,
     #     )
 
+    @property
+    def routes(self) -> list:
+        # built on demand by walking up the contexts,
+        # so that entering a context does not copy the routes of every ancestor
+        routes = self.context.routes if self.context else []
+        if self.route:
+            routes.append(self.route)
+        return routes
+
     @property
     def transformer(self) -> TypeTransformer:
         return self.options.transformer_cls(self)
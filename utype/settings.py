@@ -26,6 +26,8 @@ class WarningSettings:
     rule_none_arg_in_unsupported_origin: bool = True
     rule_args_in_any: bool = True
 
+    alias_generator_failed: bool = True
+
     def warn(self, message: str, type: str = None):
         if self.disabled:
             return
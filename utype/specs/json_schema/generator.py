@@ -36,6 +36,11 @@ class JsonSchemaGenerator:
         self.output = output
         self.options = Options(mode=mode)
         # can generate based on mode and input/output
+        self._generating = set()
+        # dataclasses that are currently being generated, to detect reference cycles
+        self._local_names = {}
+        self._local_defs = {}
+        # without a defs dict, the types of non-root cycles go to the '$defs' of the document
 
     def generate_for_type(self, t: type):
         if t is None:
@@ -141,9 +146,16 @@ class JsonSchemaGenerator:
             return {}
 
     def __call__(self) -> dict:
+        self._local_names = {}
+        self._local_defs = {}
         if inspect.isfunction(self.t):
-            return self.generate_for_function(self.t)
-        return self.generate_for_type(self.t)
+            data = self.generate_for_function(self.t)
+        else:
+            data = self.generate_for_type(self.t)
+        if self._local_defs:
+            data = dict(data)
+            data.update({"$defs": self._local_defs})
+        return data
 
     def get_defs(self) -> Dict[str, dict]:
         defs = {}
@@ -292,6 +304,11 @@ class JsonSchemaGenerator:
             cls_name = self.set_def(cls_name, t, data=None)
             # set data to None:
             # avoid cascade references
+        elif t in self._generating:
+            # recursive reference without defs, cannot expand further
+            if t is self.t:
+                return {"$ref": "#"}
+            return {"$ref": f"{self.DEFAULT_REF_PREFIX}{self._set_local_def(cls_name, t)}"}
 
         data = {"type": "object"}
         required = []
@@ -304,20 +321,24 @@ class JsonSchemaGenerator:
             if parser.output_options:
                 options = parser.output_options
 
-        for name, field in parser.fields.items():
-            value = self.generate_for_field(field, options=options)
-            if value is None:
-                continue
-            properties[name] = value
-            if field.dependencies:
-                dependent_required[name] = field.dependencies
-            if field.is_required(options or self.options):
-                # will count options.ignore_required in
-                required.append(name)
-            elif self.output:
-                if not field.no_default:
-                    # if field has default, the value is required in the output data
+        self._generating.add(t)
+        try:
+            for name, field in parser.fields.items():
+                value = self.generate_for_field(field, options=options)
+                if value is None:
+                    continue
+                properties[name] = value
+                if field.dependencies:
+                    dependent_required[name] = field.dependencies
+                if field.is_required(options or self.options):
+                    # will count options.ignore_required in
                     required.append(name)
+                elif self.output:
+                    if not field.no_default:
+                        # if field has default, the value is required in the output data
+                        required.append(name)
+        finally:
+            self._generating.discard(t)
 
         data.update(properties=properties)
         if required:
@@ -339,8 +360,25 @@ class JsonSchemaGenerator:
 
         if isinstance(self.defs, dict):
             return {"$ref": f"{self.ref_prefix}{self.set_def(cls_name, t, data)}"}
+        local_name = self._local_names.get(t)
+        if local_name:
+            self._local_defs[local_name] = data
+            return {"$ref": f"{self.DEFAULT_REF_PREFIX}{local_name}"}
         return data
 
+    def _set_local_def(self, name: str, t: type) -> str:
+        if t in self._local_names:
+            return self._local_names[t]
+        n = 0
+        names = set(self._local_names.values())
+        while True:
+            _name = name + (f'_{n}' if n else '')
+            if _name not in names:
+                break
+            n += 1
+        self._local_names[t] = _name
+        return _name
+
     def generate_for_function(self, f):
         if not inspect.isfunction(f):
             raise TypeError(f'Invalid function: {f}')
@@ -0,0 +1,11 @@
+import importlib
+
+
+def __getattr__(name):
+    # load submodules on attribute access, e.g. "utype.utils.encode" after "import utype"
+    try:
+        return importlib.import_module(f'.{name}', __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f'{__name__}.{name}':
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
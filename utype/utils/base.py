@@ -78,6 +78,9 @@ class TypeRegistry:
             self._registry.insert(0, (detector, f, priority))
             if priority:
                 self._registry.sort(key=lambda v: -v[2])
+            if self._cache:
+                # resolved types may be taken by the new registration
+                self._cache.clear()
             return f
 
         # before runtime, type will be compiled and applied
@@ -88,11 +91,17 @@ class TypeRegistry:
     def resolve(self, t: type) -> Optional[Callable]:
         # resolve to it's subclass if both subclass and baseclass is provided
         # like Schema type will not resolve to dict
-        if self.shortcut and hasattr(t, self.shortcut) and self.validator(getattr(t, self.shortcut)):
-            # this type already got a callable transformer, do not resolve then
-            return getattr(t, self.shortcut)
-        if self.cache and t in self._cache:
-            return self._cache[t]
+        if self.shortcut:
+            shortcut = getattr(t, self.shortcut, None)
+            if shortcut is not None and self.validator(shortcut):
+                # this type already got a callable transformer, do not resolve then
+                return shortcut
+        if self.cache:
+            try:
+                # single lookup on the hit path
+                return self._cache[t]
+            except KeyError:
+                pass
         for detector, trans, priority in self._registry:
             try:
                 if detector(t):
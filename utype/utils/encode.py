@@ -12,6 +12,11 @@ from ipaddress import IPv4Address, IPv6Address, IPv4Network, IPv6Network
 from pathlib import PurePath
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 encoder_registry = TypeRegistry('encoder', cache=True, shortcut='__encoder__')
 register_encoder = encoder_registry.register
 
@@ -35,19 +40,64 @@ class JSONSerializer:
     ensure_ascii = False
     skipkeys = True
 
+    _encoder = None
+
+    @property
+    def encoder(self) -> json.JSONEncoder:
+        # the encoder holds no per-call state, reuse it until the settings change
+        settings = (self.encoder_cls, self.separators, self.ensure_ascii, self.skipkeys)
+        if self._encoder is None or self._encoder[0] != settings:
+            self._encoder = (settings, self.encoder_cls(
+                separators=self.separators,
+                ensure_ascii=self.ensure_ascii,
+                skipkeys=self.skipkeys
+            ))
+        return self._encoder[1]
+
     def dumps(self, obj):
-        return json.dumps(
-            obj,
-            separators=self.separators,
-            cls=self.encoder_cls,
-            ensure_ascii=self.ensure_ascii,
-            skipkeys=self.skipkeys
-        ).encode(self.charset)
+        return self.encoder.encode(obj).encode(self.charset)
 
     def loads(self, data: bytes):
         return json.loads(data.decode(self.charset))
 
 
+class ORJSONSerializer(JSONSerializer):
+    """
+    JSONSerializer backed by orjson if it is installed (falls back to json otherwise),
+    the types that orjson does not handle natively are encoded by the encoder registry.
+    Data that orjson rejects (integers beyond 64-bit, non-str dict keys, ...)
+    and non-default ensure_ascii / separators also go through json,
+    and orjson writes NaN / Infinity as null where json writes NaN / Infinity
+    """
+    charset = 'utf-8'   # orjson always output utf-8
+
+    @property
+    def option(self) -> int:
+        # let date / time / datetime and dataclasses go through the registered encoders like json does,
+        # non-str keys are rejected by orjson and handled by json (which converts or skips them)
+        return orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    @staticmethod
+    def default(o):
+        encoder = encoder_registry.resolve(type(o))
+        if encoder:
+            return encoder(o)
+        raise TypeError(f'Object of type {o.__class__.__name__} is not JSON serializable')
+
+    def dumps(self, obj):
+        if orjson is None or self.ensure_ascii or self.separators != JSONSerializer.separators:
+            return super().dumps(obj)
+        try:
+            return orjson.dumps(obj, default=self.default, option=self.option)
+        except orjson.JSONEncodeError:
+            return super().dumps(obj)
+
+    def loads(self, data: bytes):
+        if orjson is None:
+            return super().loads(data)
+        return orjson.loads(data)
+
+
 def duration_iso_string(duration: timedelta):
     if duration < timedelta(0):
         sign = "-"
@@ -1,7 +1,9 @@
-import warnings
+import re
+from functools import lru_cache
 from typing import Callable, List, Union
 
 from .functional import multi
+from ..settings import warning_settings
 
 
 class CaseStyle:
@@ -13,6 +15,9 @@ class CaseStyle:
     CAP_SNAKE_CASE = "cap_snake"
 
 
+# an underscore goes before every upper case letter except the first one
+SNAKE_BOUNDARY_REG = re.compile(r"(?<!^)(?=[A-Z])")
+
 CASE_STYLES = [
     CaseStyle.camelCase,
     CaseStyle.PascalCase,
@@ -22,42 +27,81 @@ CASE_STYLES = [
     CaseStyle.CAP_SNAKE_CASE,
 ]
 
+# exact (lower case) style names, resolved without the guessing below
+CASE_STYLE_NAMES = {
+    **{style: style for style in CASE_STYLES},
+    **{name.lower(): style for name, style in vars(CaseStyle).items() if not name.startswith("_")},
+}
+
 
 class AliasGenerator:
+    __instances__ = {}
+    KEY_CACHE_SIZE = 4096
+
+    @classmethod
+    def get(cls, generator: Union[str, Callable]) -> "AliasGenerator":
+        # generators are stateless, share one instance per (class, style)
+        # only the fixed style names are shared, so the registry stays bounded
+        style = CASE_STYLE_NAMES.get(generator) if isinstance(generator, str) else None
+        if not style:
+            return cls(generator=generator)
+        key = (cls, style)
+        inst = cls.__instances__.get(key)
+        if inst is None:
+            inst = cls.__instances__[key] = cls(generator=style)
+        return inst
+
     @classmethod
     def guess_style(cls, style: Union[str, Callable]):
         if callable(style):
             return style
         if not isinstance(style, str) or not style:
             return None
-        style = style.lower()
-        if CaseStyle.camelCase in style:
+        lower = style.lower()
+        exact = CASE_STYLE_NAMES.get(lower)
+        if exact:
+            return exact
+        if CaseStyle.camelCase in lower:
             return CaseStyle.camelCase
-        if CaseStyle.snake_case in style:
-            if "cap" in style:
+        if CaseStyle.snake_case in lower:
+            if "cap" in lower:
                 return CaseStyle.CAP_SNAKE_CASE
             return CaseStyle.snake_case
-        if CaseStyle.kebab_case in style:
-            if "cap" in style:
+        if CaseStyle.kebab_case in lower:
+            if "cap" in lower:
                 return CaseStyle.CAP_KEBAB_CASE
             return CaseStyle.kebab_case
-        if CaseStyle.PascalCase in style:
+        if CaseStyle.PascalCase in lower:
             return CaseStyle.PascalCase
-        # guess val
-        ans = "".join(filter(str.isalnum, style))
+        # guess by the example value, one pass over its alphanumerics in the original case
+        has_upper = has_lower = False
+        first = None
+        for c in style:
+            if not c.isalnum():
+                continue
+            if first is None:
+                first = c
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+        if first is None:
+            # no alphanumerics, nothing to guess from
+            return None
+        all_upper = has_upper and not has_lower
         if "_" in style:
-            if ans.isupper():
+            if all_upper:
                 return CaseStyle.CAP_SNAKE_CASE
             return CaseStyle.snake_case
         if "-" in style:
-            if ans.isupper():
+            if all_upper:
                 return CaseStyle.CAP_KEBAB_CASE
             return CaseStyle.kebab_case
-        if ans.isupper():
+        if all_upper:
             return CaseStyle.CAP_SNAKE_CASE
-        if ans.islower():
+        if has_lower and not has_upper:
             return CaseStyle.snake_case
-        if ans[0].islower():
+        if first.islower():
             return CaseStyle.camelCase
         return CaseStyle.PascalCase
 
@@ -73,38 +117,65 @@ class AliasGenerator:
             self.func = getattr(self.__class__, self.generator, None)
         if not self.func:
             raise ValueError(f"Invalid case style: {generator}")
+        # converted str keys of dict data, payloads tend to repeat the same keys
+        self._key_cache = {}
+        # error types already reported by _convert_str
+        self._warned = set()
 
     def __call__(self, data):
         if not self.generator or not data:
             return data
-        if multi(data):
+        # str / dict are disjoint from multi(), check the common types first
+        t = type(data)
+        if t is str or isinstance(data, str):
+            return self._convert_str(data)
+        elif t is dict or isinstance(data, dict):
+            return self._convert_dict(data)
+        elif t is list or t is tuple or multi(data):
             return [self(d) for d in data]
-        elif isinstance(data, dict):
-            result = {}
-            if data.get("@"):
-                return data
-            for key, val in data.items():
+        return data
+
+    def _convert_str(self, data: str):
+        try:
+            return self.func(data)
+        except Exception as e:
+            # warn once per error type, a malformed payload can fail on every key
+            if type(e) not in self._warned:
+                self._warned.add(type(e))
+                warning_settings.warn(
+                    f"apply field transformer failed with error: {e}, ignoring...",
+                    "alias_generator_failed"
+                )
+            return data
+
+    def _convert_dict(self, data: dict):
+        if data.get("@"):
+            return data
+        result = {}
+        key_cache = self._key_cache
+        for key, val in data.items():
+            if type(key) is str:
+                k = key_cache.get(key)
+                if k is None:
+                    # call the str converter directly instead of dispatching again
+                    k = self._convert_str(key) if key else key
+                    if len(key_cache) < self.KEY_CACHE_SIZE:
+                        key_cache[key] = k
+            else:
                 k = self(key)
-                if not self.allow_conflict and k in result:
-                    raise ValueError(f"Duplicate data key: {k}")
+            if not self.allow_conflict and k in result:
+                raise ValueError(f"Duplicate data key: {k}")
+            if type(k) is not str:
                 if multi(k) and k:
                     k = list(k)[0]
                 if not isinstance(k, str):
                     # invalid key, ignore
                     continue
-                result[k] = val
-            return result
-        elif isinstance(data, str):
-            try:
-                return self.func(data)
-            except Exception as e:
-                warnings.warn(
-                    f"apply field transformer failed with error: {e}, ignoring..."
-                )
-                return data
-        return data
+            result[k] = val
+        return result
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def pascal(cls, val: str):
         if not val:
             return ""
@@ -131,9 +202,13 @@ class AliasGenerator:
         return val
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def snake(cls, val: str):
         if not val:
             return ""
+        if val.islower() and "-" not in val:
+            # already snake_case
+            return val
         if "_" in val:
             # guess type: snake / cap_snake
             return val.lower()
@@ -150,32 +225,40 @@ class AliasGenerator:
         if val.isupper():
             return val.lower()
 
-        s = ""
-        for i, c in enumerate(val):
-            if c.isupper():
-                if i:
-                    # not for first upper case
-                    s += "_"
-                c = c.lower()
-            s += c
+        if val.isascii():
+            return SNAKE_BOUNDARY_REG.sub("_", val).lower()
 
-        return s
+        return val[0].lower() + "".join(
+            "_" + c.lower() if c.isupper() else c for c in val[1:]
+        )
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def camel(cls, val: str):
         val = cls.pascal(val)
         return val[0].lower() + val[1:]
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def cap_snake(cls, val: str):
+        if val.isupper() and "-" not in val:
+            # already CAP_SNAKE_CASE
+            return val
         return cls.snake(val).upper()
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def kebab(cls, val: str):
+        if "-" in val and "_" not in val:
+            # already kebab, skip the round trip through snake
+            return val.lower()
         return cls.snake(val).replace("_", "-")
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def cap_kebab(cls, val: str):
+        if "-" in val and "_" not in val:
+            return val.upper()
         return cls.cap_snake(val).replace("_", "-")
 
     @classmethod
@@ -188,17 +271,27 @@ class AliasGenerator:
             generator = CASE_STYLES
         elif not multi(generator):
             generator = [generator]
+        try:
+            # the same field names are aliased over and over across schemas
+            return list(cls._generate_aliases(val, tuple(generator)))
+        except TypeError:
+            # unhashable generator
+            return list(cls._generate_aliases.__wrapped__(cls, val, generator))
+
+    @classmethod
+    @lru_cache(maxsize=2048)
+    def _generate_aliases(cls, val: str, generator: tuple):
         aliases = []
 
         def _validator(v):
             return isinstance(v, str) and v and v != val
 
         for g in generator:
-            res = cls(generator=g)(val)
+            res = cls.get(g)(val)
             if multi(res):
                 for r in res:
                     if _validator(r):
                         aliases.append(r)
             elif _validator(res):
                 aliases.append(res)
-        return aliases
+        return tuple(aliases)
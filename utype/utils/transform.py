@@ -1,3 +1,4 @@
+import ast
 import decimal
 import io
 import json
@@ -8,7 +9,8 @@ from collections.abc import Iterable, Iterator, Mapping, Sequence
 from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import TYPE_CHECKING, Callable, Optional, Type, TypeVar
+from typing import TYPE_CHECKING, Callable, List, Optional, Type, TypeVar
+from urllib.parse import parse_qs
 from uuid import UUID
 
 from .compat import ForwardRef
@@ -73,6 +75,17 @@ class TypeTransformer:
         "%Y-%m-%d %H:%M"
     ]
 
+    # the common ISO 8601 forms that datetime.fromisoformat parses identically across versions,
+    # checked before falling back to the strptime loop over DATETIME_FORMATS
+    ISO_DATETIME_REG = re.compile(
+        r"^\d{4}-\d{2}-\d{2}"
+        r"(?:[ T]\d{2}:\d{2}(?::\d{2}(?:\.\d{3}(?:\d{3})?)?)?(?:[+-]\d{2}:\d{2})?)?"
+        r"$"
+    )
+
+    # a utc offset (like +0800 / -05:00) that follows the time part
+    UTC_OFFSET_REG = re.compile(r"\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(\s?)[+-]\d{2}:?\d{2}$")
+
     EPOCH = datetime(1970, 1, 1)
     MS_WATERSHED = int(2e10)
     ARRAY_SEPARATORS = (",", ";")
@@ -107,6 +120,8 @@ class TypeTransformer:
         ),
     ]
 
+    __slots__ = ("context", "no_explicit_cast", "no_data_loss", "unresolved_types")
+
     def __init__(
         self,
         context: "RuntimeContext",
@@ -114,19 +129,20 @@ class TypeTransformer:
         no_data_loss: bool = None,
         unresolved_types: str = None,
     ):
+        options = context.options
         self.context = context
         self.no_explicit_cast = (
             no_explicit_cast
             if no_explicit_cast is not None
-            else context.options.no_explicit_cast
+            else options.no_explicit_cast
         )
         self.no_data_loss = (
-            no_data_loss if no_data_loss is not None else context.options.no_data_loss
+            no_data_loss if no_data_loss is not None else options.no_data_loss
         )
         self.unresolved_types = (
             unresolved_types
             if unresolved_types is not None
-            else context.options.unresolved_types
+            else options.unresolved_types
         )
 
     @property
@@ -158,11 +174,12 @@ class TypeTransformer:
             return value.value
         return value
 
-    def _from_byte_like(self, data):
+    def _from_byte_like(self, data, strict: bool = False):
         if isinstance(data, (bytes, bytearray, memoryview)):
-            if isinstance(data, memoryview):
-                data = bytes(data)
-            return data.decode(errors="strict" if self.no_data_loss else "ignore")
+            if isinstance(data, memoryview) and not data.c_contiguous:
+                data = data.tobytes()
+            # decode from the buffer directly, without copying a memoryview to bytes first
+            return str(data, "utf-8", "strict" if strict or self.no_data_loss else "ignore")
         return data
 
     def _attempt_from_number(self, data):
@@ -210,7 +227,8 @@ class TypeTransformer:
         if isinstance(data, t):
             # we will follow the type
             return data
-        value = self.to_array_types(data, list)
+        # a concrete list can be passed to the constructor directly
+        value = data if type(data) is list else self.to_array_types(data, list)
         if not getattr(t, "__abstractmethods__", None):
             return t(value)
         # if type is still abstracted, just returning the list result
@@ -221,7 +239,8 @@ class TypeTransformer:
         if isinstance(data, t):
             # we will follow the type
             return data
-        value = self.to_dict(data, dict)
+        # a concrete dict can be passed to the constructor directly
+        value = data if type(data) is dict else self.to_dict(data, dict)
         if not getattr(t, "__abstractmethods__", None):
             return t(value)
         return value
@@ -237,6 +256,9 @@ class TypeTransformer:
 
     @registry.register(bytes, bytearray, memoryview)
     def to_bytes(self, data, t: Type[bytes] = bytes):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return t(data)
+
         data = self._attempt_from(data)
 
         if isinstance(data, (bytes, bytearray, memoryview)):
@@ -272,15 +294,10 @@ class TypeTransformer:
             # [{"a": b}]
             # {1, 2, 3}
             # a,b,c
-            if any(
-                data.startswith(v[0]) and data.endswith(v[1])
-                for v in self.STRUCTURE_BRACKET
-            ):
+            if data[:1] + data[-1:] in self.STRUCTURE_BRACKET:
                 try:
                     data = json.loads(data)
                 except json.JSONDecodeError:
-                    import ast
-
                     data = ast.literal_eval(data)
                     if multi(data):
                         return t(data)
@@ -349,12 +366,7 @@ class TypeTransformer:
                 return t(json.loads(data, strict=self.no_data_loss))  # noqa
             except json.decoder.JSONDecodeError:
                 data = data.strip()
-                if any(
-                    data.startswith(v[0]) and data.endswith(v[1])
-                    for v in self.STRUCTURE_BRACKET
-                ):
-                    import ast
-
+                if data[:1] + data[-1:] in self.STRUCTURE_BRACKET:
                     res = self._attempt_from(ast.literal_eval(data))
                     if isinstance(res, dict):
                         # maybe set
@@ -363,18 +375,15 @@ class TypeTransformer:
                 if "=" in data:
                     if "&" in data:
                         # a=b&c=d   querystring index
-                        from urllib.parse import parse_qs
-
                         qs = parse_qs(data)
                         return t({k: v[0] if len(v) == 1 else v for k, v in qs.items()})
                     spliter = ";" if ";" in data else ","
                     # cookie syntax or comma separate syntax
-                    return t(
-                        {
-                            value.split("=")[0].strip(): ("=".join(value.split("=")[1:]).strip())
-                            for value in data.split(spliter)
-                        }
-                    )
+                    result = {}
+                    for value in data.split(spliter):
+                        key, _, val = value.partition("=")
+                        result[key.strip()] = val.strip()
+                    return t(result)
                 raise
 
         from xml.etree.ElementTree import Element
@@ -393,6 +402,9 @@ class TypeTransformer:
         if self.no_explicit_cast:
             if not isinstance(data, (int, float, Decimal)):
                 raise TypeError
+        elif type(data) is str and data:
+            # a plain non-empty string goes to float() unchanged
+            return t(data)
         else:
             data = self._attempt_from_number(data)
 
@@ -412,10 +424,18 @@ class TypeTransformer:
         else:
             data = self._attempt_from_number(data)
             if isinstance(data, str):
-                if data.lower() in self.FALSE_VALUES:
+                rep = data.lower()
+                if rep in self.FALSE_VALUES:
                     return 0
-                if data.lower() in self.TRUE_VALUES:
+                if rep in self.TRUE_VALUES:
                     return 1
+                if (data[1:] if data[:1] in ("-", "+") else data).isdecimal():
+                    # plain (signed) digits can be converted directly, skip the Decimal route
+                    try:
+                        return t(data)
+                    except ValueError:
+                        # exceeds the int string conversion limit
+                        pass
             elif isinstance(data, t):
                 return data
 
@@ -446,7 +466,13 @@ class TypeTransformer:
         else:
             data = self._attempt_from_number(data)
 
-        return t(str(data).strip())  # noqa
+        if type(data) is int:
+            # exact, no need of the str round trip
+            return t(data)  # noqa
+        if not isinstance(data, str):
+            # use str for float to get the shortest repr (10.1 -> Decimal('10.1'))
+            data = str(data)
+        return t(data.strip())  # noqa
 
     @registry.register(complex)
     def to_complex(self, data, t=complex) -> complex:
@@ -475,9 +501,9 @@ class TypeTransformer:
             return False
         if self.no_explicit_cast:
             raise TypeError
-        if isinstance(data, bytes):
-            data = data.decode()
-        rep = str(data).lower()
+        # undecodable bytes are not a boolean, do not drop them silently
+        data = self._from_byte_like(data, strict=True)
+        rep = data.lower() if isinstance(data, str) else str(data).lower()
         if rep in self.FALSE_VALUES:
             return False
         elif rep in self.TRUE_VALUES:
@@ -522,25 +548,40 @@ class TypeTransformer:
         is_utc = "GMT" in data or 'UTC' in data or data.endswith("Z") and "T" in data
         data = data.replace('GMT', '').replace('UTC', '').replace('TZD', '').rstrip('Z').strip()
 
+        if self.ISO_DATETIME_REG.match(data):
+            try:
+                val = t.fromisoformat(data)
+            except ValueError:
+                pass
+            else:
+                if is_utc:
+                    val = val.replace(tzinfo=timezone.utc)
+                return val
+
         if date_first:
             formats = self.DATE_FORMATS + self.DATETIME_FORMATS
         else:
             formats = self.DATETIME_FORMATS + self.DATE_FORMATS
 
-        for f in formats:
-            try:
-                val = t.strptime(data, f)
-                if is_utc:
-                    val = val.replace(tzinfo=timezone.utc)
-                return val
-            except (TypeError, ValueError, re.error):
-                continue
+        offset = self.UTC_OFFSET_REG.search(data)
+        if offset:
+            # formats without %z can never match a trailing utc offset, skip them
+            tz_suffix = ' %z' if offset.group(1) else '%z'
+        else:
+            for f in formats:
+                try:
+                    val = t.strptime(data, f)
+                    if is_utc:
+                        val = val.replace(tzinfo=timezone.utc)
+                    return val
+                except (TypeError, ValueError, re.error):
+                    continue
+            tz_suffix = (' %z' if ' +' in data else '%z') if '+' in data else None
 
-        if '+' in str(data):
+        if tz_suffix:
             for f in formats:
                 try:
-                    # val = t.strptime(data, f + ' %z')
-                    val = t.strptime(data, f + (' %z' if ' +' in str(data) else '%z'))
+                    val = t.strptime(data, f + tz_suffix)
                     if is_utc:
                         val = val.replace(tzinfo=timezone.utc)
                     return val
@@ -563,14 +604,16 @@ class TypeTransformer:
         if isinstance(data, t):
             return data
         data = self._from_byte_like(self._attempt_from(data))
-        try:
-            num = self.to_float(data, float)
-        except (TypeError, ValueError):
-            pass
-        else:
-            if self.no_explicit_cast and isinstance(data, str):
-                raise TypeError
-            return t(seconds=num)
+        if not isinstance(data, str) or "P" not in data:
+            # ISO 8601 durations (like P1DT2H) are never numbers, skip the attempt
+            try:
+                num = self.to_float(data, float)
+            except (TypeError, ValueError):
+                pass
+            else:
+                if self.no_explicit_cast and isinstance(data, str):
+                    raise TypeError
+                return t(seconds=num)
         if isinstance(data, str):
             for regex in self.DURATION_REGS:
                 match = regex.match(data)
@@ -628,12 +671,10 @@ class TypeTransformer:
             return t(data)
 
         elif isinstance(data, (bytes, bytearray)):
-            try:
-                return t(data.decode())
-            except ValueError:
-                # 16 bytes in big-endian order as the bytes argument fail
-                # the above check
-                return t(bytes=data)
+            if len(data) == 16:
+                # 16 bytes in big-endian order, cannot be a valid hex representation
+                return t(bytes=bytes(data))
+            return t(data.decode())
 
         if not self.no_explicit_cast:
             if not self.no_data_loss and isinstance(data, (float, Decimal)):
@@ -696,7 +737,7 @@ class TypeTransformer:
     def apply(self, data, t: Type[T], func=None) -> T:
         if not func:
             return self(data, t)
-        if type(data) == t:
+        if type(data) is t:
             # strict equal. not isinstance, like datetime is instance of date
             return data
         if isinstance(t, ForwardRef):
@@ -706,13 +747,15 @@ class TypeTransformer:
         return func(self, data, t)
 
     def __call__(self, data, t: Type[T]) -> T:
+        if type(data) is t:
+            # strict equal. not isinstance, like datetime is instance of date
+            return data
         if isinstance(t, ForwardRef):
             if not t.__forward_evaluated__:
                 raise TypeError(f"ForwardRef: {t} not evaluated")
             t = t.__forward_value__
-        if type(data) == t:
-            # strict equal. not isinstance, like datetime is instance of date
-            return data
+            if type(data) is t:
+                return data
         transformer = self.resolver_transformer(t)
         if not transformer:
             return self.handle_unresolved(data, t)
@@ -720,7 +763,18 @@ class TypeTransformer:
 
 
 def type_transform(data, type: Type[T], options=None) -> T:
-    from ..parser.options import Options
+    from ..parser.options import DEFAULT_OPTIONS
 
-    context = (options or Options()).make_context()
+    context = (options or DEFAULT_OPTIONS).make_context()
     return context.transformer(data, type)
+
+
+def type_transform_many(values: Iterable, type: Type[T], options=None) -> List[T]:
+    # transform a batch of values to the same type
+    # the context, transformer and transform function is resolved only once
+    from ..parser.options import DEFAULT_OPTIONS
+
+    context = (options or DEFAULT_OPTIONS).make_context()
+    transformer = context.transformer
+    func = transformer.resolver_transformer(type)
+    return [transformer.apply(value, type, func=func) for value in values]